@@ -0,0 +1,46 @@
+"""The Route B Smart Meter integration."""
+
+from __future__ import annotations
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import Platform
+from homeassistant.core import HomeAssistant
+
+from .broute_reader import BRouteConfig
+from .const import (
+    CONF_ROUTE_B_ID,
+    CONF_ROUTE_B_PWD,
+    CONF_SERIAL_PORT,
+    DEFAULT_SERIAL_PORT,
+)
+from .coordinator import BRouteDataCoordinator
+
+PLATFORMS: list[Platform] = [Platform.SENSOR]
+
+type BRouteConfigEntry = ConfigEntry[BRouteDataCoordinator]
+
+
+async def async_setup_entry(hass: HomeAssistant, entry: BRouteConfigEntry) -> bool:
+    """Set up Route B Smart Meter from a config entry."""
+    data = entry.data
+    config = BRouteConfig(
+        route_b_id=data[CONF_ROUTE_B_ID],
+        route_b_pwd=data[CONF_ROUTE_B_PWD],
+        serial_port=data.get(CONF_SERIAL_PORT, DEFAULT_SERIAL_PORT),
+    )
+    coordinator = BRouteDataCoordinator(hass, config)
+
+    await coordinator.async_config_entry_first_refresh()
+
+    entry.runtime_data = coordinator
+
+    entry.async_on_unload(coordinator.async_close_reader)
+
+    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+
+    return True
+
+
+async def async_unload_entry(hass: HomeAssistant, entry: BRouteConfigEntry) -> bool:
+    """Unload a config entry."""
+    return await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
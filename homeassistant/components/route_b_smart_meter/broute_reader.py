@@ -0,0 +1,482 @@
+"""Reader for B-route smart meters behind an SKSTACK-IP Wi-SUN adapter."""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta, timezone
+import logging
+import os
+import re
+import select
+import struct
+import time
+from typing import Any
+
+import numpy as np
+import serial
+
+from .const import (
+    DEFAULT_SERIAL_PORT,
+    KEY_E7_POWER,
+    KEY_E8_CURRENT,
+    KEY_E9_VOLTAGE,
+    KEY_EA_FORWARD,
+    KEY_EB_REVERSE,
+    SENSOR_KEYS,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+# Meter timestamps are always JST; a fixed offset avoids dragging in a
+# tzdata lookup for a zone that has no DST.
+JST = timezone(timedelta(hours=9))
+
+# The poll request never changes, so build it once: a property read (ESV
+# 0x62) to the low-voltage smart meter object for the instantaneous power,
+# currents and voltages plus the cumulative energy values in both directions.
+_READ_FRAME = (
+    b"\x10\x81"  # EHD: ECHONET Lite, format 1
+    b"\x00\x01"  # TID
+    b"\x05\xff\x01"  # SEOJ: management controller
+    b"\x02\x88\x01"  # DEOJ: low-voltage smart meter
+    b"\x62"  # ESV: property value read request
+    b"\x05"  # OPC
+    b"\xe7\x00\xe8\x00\xe9\x00\xea\x00\xeb\x00"  # EPC/PDC pairs
+)
+_FRAME_LEN_HEX = f"{len(_READ_FRAME):04X}".encode()
+
+# SKSCAN durations to try; each channel is scanned for 9.6 ms * 2^duration.
+_SCAN_DURATION_MIN = 4
+_SCAN_DURATION_MAX = 8
+
+# How long to wait for the ERXUDP response to a poll before giving up.
+_RESPONSE_TIMEOUT = 3.0
+
+# How long the port may stay silent before a read loop gives up.
+_READ_TIMEOUT = 2.0
+
+# Property payload layouts, unpacked in a single C call each. The signed
+# ">i" handles the E7 sign bit natively.
+_E7_FMT = struct.Struct(">i")  # instantaneous power, W
+_E8_FMT = struct.Struct(">HH")  # R/T phase, 0.1 A units (also E9, 0.1 V)
+_EAEB_FMT = struct.Struct(">HBBBBBI")  # timestamp + cumulative, 0.1 kWh
+
+# Interned adapter line prefixes, so the dispatch loops compare against a
+# single hot constant instead of materializing a literal per check.
+_PFX_ERXUDP = b"ERXUDP"
+_PFX_OK = b"OK"
+_PFX_FAIL = b"FAIL"
+_PFX_EVENT_22 = b"EVENT 22"
+_PFX_EVENT_24 = b"EVENT 24"
+_PFX_EVENT_25 = b"EVENT 25"
+
+# Commands whose arguments are the B-route credentials; their payloads
+# must never reach the logs.
+_PFX_CREDENTIAL = (b"SKSETPWD", b"SKSETRBID")
+
+# Byte layout of a complete read response to _READ_FRAME: the 12-byte
+# header followed by the five properties in request order. Used by the
+# batch parser to slice whole columns out of stacked frames.
+_BATCH_FRAME_LEN = 56
+_OFF_E7_EPC, _OFF_E7_EDT = 12, 14  # 4 bytes, signed W
+_OFF_E8_EPC, _OFF_E8_EDT = 18, 20  # 2 x u16, 0.1 A
+_OFF_E9_EPC, _OFF_E9_EDT = 24, 26  # 2 x u16, 0.1 V
+_OFF_EA_EPC, _OFF_EA_VAL = 30, 39  # u32 after the 7-byte timestamp
+_OFF_EB_EPC, _OFF_EB_VAL = 43, 52
+
+# Pulls the fields of interest out of an accumulated EPANDESC report in
+# one pass instead of decoding and splitting every line.
+_SCAN_RE = re.compile(rb"Channel:(\S+)\s.*?Pan ID:(\S+)\s.*?Addr:(\S+)", re.DOTALL)
+
+
+class BRouteError(Exception):
+    """Raised when the conversation with the smart meter fails."""
+
+
+@dataclass(slots=True, frozen=True)
+class BRouteConfig:
+    """Connection settings for a B-route smart meter."""
+
+    route_b_id: str
+    route_b_pwd: str
+    serial_port: str = DEFAULT_SERIAL_PORT
+
+
+def _parse_echonet_frame(
+    echonet_bytes: bytes | memoryview,
+) -> dict[str, Any] | None:
+    """Parse an ECHONET Lite frame into its property list.
+
+    Walks the frame with index arithmetic only, so the per-poll cost is
+    a handful of integer ops plus one slice per property payload. Accepts
+    a memoryview, in which case the property payloads are zero-copy views.
+    """
+    size = len(echonet_bytes)
+    if size < 12:
+        return None
+    if echonet_bytes[0] != 0x10 or echonet_bytes[1] != 0x81:
+        return None
+    tid = (echonet_bytes[2] << 8) | echonet_bytes[3]
+    esv = echonet_bytes[10]
+    opc = echonet_bytes[11]
+    # Slice the payloads off a memoryview so each EDT is a zero-copy
+    # window into the frame; struct.unpack_from reads them natively.
+    view = memoryview(echonet_bytes)
+    properties: list[tuple[int, int, memoryview]] = []
+    offset = 12
+    for _ in range(opc):
+        if offset + 2 > size:
+            break
+        epc = echonet_bytes[offset]
+        pdc = echonet_bytes[offset + 1]
+        edt = view[offset + 2 : offset + 2 + pdc]
+        properties.append((epc, pdc, edt))
+        offset += 2 + pdc
+    return {"tid": tid, "esv": esv, "properties": properties}
+
+
+def _parse_cumulative(edt: bytes | memoryview) -> float:
+    """Parse an EA/EB cumulative energy record with its timestamp."""
+    year, month, day, hour, minute, second, value = _EAEB_FMT.unpack_from(edt)
+    if _LOGGER.isEnabledFor(logging.DEBUG):
+        # The timestamp is only reported, not returned; skip the
+        # datetime work entirely unless someone is watching.
+        measured_at = datetime(year, month, day, hour, minute, second, tzinfo=JST)
+        _LOGGER.debug(
+            "Cumulative value measured at %s",
+            measured_at.astimezone(UTC).isoformat(),
+        )
+    return value / 10
+
+
+_IDX_E7 = SENSOR_KEYS.index(KEY_E7_POWER)
+_IDX_E8 = SENSOR_KEYS.index(KEY_E8_CURRENT)
+_IDX_E9 = SENSOR_KEYS.index(KEY_E9_VOLTAGE)
+_IDX_EA = SENSOR_KEYS.index(KEY_EA_FORWARD)
+_IDX_EB = SENSOR_KEYS.index(KEY_EB_REVERSE)
+
+
+def _parse_e7(pdc: int, edt: bytes | memoryview, out: list[float | None]) -> None:
+    """Instantaneous power, W (signed)."""
+    if pdc == 4:
+        out[_IDX_E7] = _E7_FMT.unpack_from(edt)[0]
+
+
+def _parse_e8(pdc: int, edt: bytes | memoryview, out: list[float | None]) -> None:
+    """Instantaneous R+T phase current, 0.1 A units."""
+    if pdc == 4:
+        r_phase, t_phase = _E8_FMT.unpack_from(edt)
+        out[_IDX_E8] = (r_phase + t_phase) / 10
+
+
+def _parse_e9(pdc: int, edt: bytes | memoryview, out: list[float | None]) -> None:
+    """Instantaneous phase voltage average, 0.1 V units."""
+    if pdc == 4:
+        v1, v2 = _E8_FMT.unpack_from(edt)
+        out[_IDX_E9] = (v1 + v2) / 2 / 10
+
+
+def _parse_ea(pdc: int, edt: bytes | memoryview, out: list[float | None]) -> None:
+    """Cumulative energy, normal direction."""
+    if pdc == 11:
+        out[_IDX_EA] = _parse_cumulative(edt)
+
+
+def _parse_eb(pdc: int, edt: bytes | memoryview, out: list[float | None]) -> None:
+    """Cumulative energy, reverse direction."""
+    if pdc == 11:
+        out[_IDX_EB] = _parse_cumulative(edt)
+
+
+def get_data_batch(payloads: list[bytes]) -> dict[str, np.ndarray]:
+    """Parse a batch of buffered read responses into per-key arrays.
+
+    Replaying a backlog of frames (for example after a disconnect)
+    through the scalar parser pays the interpreter loop per frame; here
+    the frames are stacked into one (N, 56) byte matrix and each value
+    is extracted as a single vectorized column view instead.
+    """
+    count = len(payloads)
+    if count == 0:
+        return {key: np.empty(0) for key in SENSOR_KEYS}
+    if any(len(payload) != _BATCH_FRAME_LEN for payload in payloads):
+        raise BRouteError("Unexpected frame length in batch")
+    arr = np.frombuffer(b"".join(payloads), dtype=np.uint8).reshape(count, -1)
+    epcs_ok = (
+        (arr[:, _OFF_E7_EPC] == 0xE7)
+        & (arr[:, _OFF_E8_EPC] == 0xE8)
+        & (arr[:, _OFF_E9_EPC] == 0xE9)
+        & (arr[:, _OFF_EA_EPC] == 0xEA)
+        & (arr[:, _OFF_EB_EPC] == 0xEB)
+    )
+    if not epcs_ok.all():
+        raise BRouteError("Unexpected property layout in batch")
+    currents = arr[:, _OFF_E8_EDT : _OFF_E8_EDT + 4].view(">u2")
+    voltages = arr[:, _OFF_E9_EDT : _OFF_E9_EDT + 4].view(">u2")
+    return {
+        KEY_E7_POWER: arr[:, _OFF_E7_EDT : _OFF_E7_EDT + 4].view(">i4").ravel(),
+        KEY_E8_CURRENT: currents.sum(axis=1) / 10,
+        KEY_E9_VOLTAGE: voltages.mean(axis=1) / 10,
+        KEY_EA_FORWARD: arr[:, _OFF_EA_VAL : _OFF_EA_VAL + 4].view(">u4").ravel() / 10,
+        KEY_EB_REVERSE: arr[:, _OFF_EB_VAL : _OFF_EB_VAL + 4].view(">u4").ravel() / 10,
+    }
+
+
+# One dict lookup dispatches each property instead of a comparison ladder,
+# and the handlers can be tuned or replaced independently.
+_EPC_HANDLERS = {
+    0xE7: _parse_e7,
+    0xE8: _parse_e8,
+    0xE9: _parse_e9,
+    0xEA: _parse_ea,
+    0xEB: _parse_eb,
+}
+
+
+class BRouteReader:
+    """Poll a low-voltage smart meter over the B-route (ECHONET Lite)."""
+
+    def __init__(self, config: BRouteConfig) -> None:
+        """Initialize the reader without touching the serial port yet."""
+        self.config = config
+        self.serial_port_name = config.serial_port
+        # The credentials go out as ASCII on every connect; encode once.
+        self._rbid_ascii = config.route_b_id.encode()
+        self._pwd_ascii = config.route_b_pwd.encode()
+        self.serial_port: serial.Serial | None = None
+        self.scan_res: dict[str, str] = {}
+        self.ipv6_addr: str | None = None
+        self._ipv6_ascii: bytes | None = None
+        self._sendto_cmd: bytes | None = None
+        self._pending = False
+        self._rxbuf = bytearray()
+        # Raw fd plus a reusable read buffer; reads go straight through
+        # os.readv for the life of the reader with no per-read allocation.
+        self._fd: int | None = None
+        self._buf = bytearray(4096)
+        self._mv = memoryview(self._buf)
+
+    def connect(self) -> None:
+        """Open the serial port and join the meter's PAN."""
+        # exclusive=True takes the POSIX lock at open instead of racing
+        # other openers later; write_timeout bounds a stalled TX so a
+        # wedged adapter cannot block the worker thread forever.
+        self.serial_port = serial.Serial(
+            port=self.serial_port_name,
+            baudrate=115200,
+            timeout=2,
+            write_timeout=2,
+            exclusive=True,
+            inter_byte_timeout=None,
+        )
+        try:
+            self._setup_link()
+        except Exception:
+            # Release the port (and its exclusive lock) on any failure,
+            # or the retry's fresh open would fail until this object
+            # happens to be garbage-collected.
+            self.close()
+            raise
+
+    def _setup_link(self) -> None:
+        """Scan for the meter and authenticate on the open port."""
+        assert self.serial_port is not None
+        try:
+            # Clear the FTDI-class 16 ms latency timer so short frames are
+            # delivered as soon as they arrive instead of per USB microframe.
+            self.serial_port.set_low_latency_mode(True)
+        except (NotImplementedError, ValueError) as err:
+            _LOGGER.debug("Low latency mode not supported: %s", err)
+        self._fd = self.serial_port.fileno()
+        self._rxbuf.clear()
+
+        self._write_cmd(b"SKSETPWD C " + self._pwd_ascii + b"\r\n")
+        self._wait_ok()
+        self._write_cmd(b"SKSETRBID " + self._rbid_ascii + b"\r\n")
+        self._wait_ok()
+
+        self._scan_channel()
+
+        self._write_cmd(f"SKSREG S2 {self.scan_res['Channel']}\r\n".encode())
+        self._wait_ok()
+        self._write_cmd(f"SKSREG S3 {self.scan_res['Pan ID']}\r\n".encode())
+        self._wait_ok()
+
+        self._write_cmd(f"SKLL64 {self.scan_res['Addr']}\r\n".encode())
+        for raw_line in self._readlines_nonblocking():
+            if raw_line and not raw_line.startswith(b"SKLL64"):
+                self.ipv6_addr = raw_line.decode("ascii")
+                break
+        if self.ipv6_addr is None:
+            raise BRouteError("No IPv6 address returned for SKLL64")
+        self._ipv6_ascii = self.ipv6_addr.encode()
+        # The poll command is identical for the life of the link.
+        self._sendto_cmd = (
+            b"SKSENDTO 1 "
+            + self._ipv6_ascii
+            + b" 0E1A 1 "
+            + _FRAME_LEN_HEX
+            + b" "
+            + _READ_FRAME
+            + b"\r\n"
+        )
+        self._pending = False
+        _LOGGER.debug("Meter link-local address: %s", self.ipv6_addr)
+
+        self._write_cmd(f"SKJOIN {self.ipv6_addr}\r\n".encode())
+        for raw_line in self._readlines_nonblocking():
+            # One prefix scan for both terminal events; most lines during
+            # the PANA exchange are neither.
+            if not raw_line.startswith((_PFX_EVENT_24, _PFX_EVENT_25)):
+                continue
+            if raw_line.startswith(_PFX_EVENT_24):
+                raise BRouteError("PANA authentication failed")
+            _LOGGER.debug("PANA authentication succeeded")
+            return
+        raise BRouteError("Timed out waiting for PANA authentication")
+
+    def close(self) -> None:
+        """Close the serial port."""
+        if self.serial_port is not None:
+            self.serial_port.close()
+            self.serial_port = None
+            self._fd = None
+
+    def get_data(self) -> dict[str, float | None]:
+        """Request the instantaneous and cumulative values from the meter.
+
+        Polls are pipelined: after a response is parsed, the next read
+        request is sent immediately so its ~1-3 s radio round trip
+        overlaps the idle time until the next poll, which then only has
+        to drain an answer that is already waiting.
+        """
+        assert self._sendto_cmd is not None
+        assert self.serial_port is not None
+        if not self._pending:
+            # No request is in flight, so anything buffered is a stale
+            # response from a poll that timed out. Drop it before writing,
+            # or the fresh request would be "answered" by old data and
+            # every following poll would lag one more interval behind.
+            self._rxbuf.clear()
+            self.serial_port.reset_input_buffer()
+            self._write_cmd(self._sendto_cmd)
+        self._pending = False
+
+        frame_info: dict[str, Any] | None = None
+        deadline = time.monotonic() + _RESPONSE_TIMEOUT
+        for raw_line in self._readlines_nonblocking(deadline):
+            if not raw_line.startswith(_PFX_ERXUDP):
+                continue
+            # The payload is the ninth field; find it with memchr-backed
+            # find() instead of split(), which would allocate nine tokens.
+            pos = 0
+            for _ in range(8):
+                pos = raw_line.find(b" ", pos) + 1
+                if pos == 0:
+                    break
+            if pos == 0:
+                continue
+            payload = memoryview(raw_line)[pos:]
+            try:
+                echonet_bytes: bytes | memoryview = bytes.fromhex(str(payload, "ascii"))
+            except (UnicodeDecodeError, ValueError):
+                echonet_bytes = payload
+            frame_info = _parse_echonet_frame(echonet_bytes)
+            if frame_info is not None:
+                break
+        if frame_info is None:
+            raise BRouteError("No ERXUDP response from the smart meter")
+
+        # Submit the next request before returning; the response arrives
+        # while Home Assistant sleeps until the next poll.
+        self._write_cmd(self._sendto_cmd)
+        self._pending = True
+
+        out: list[float | None] = [None] * len(SENSOR_KEYS)
+        for epc, pdc, edt in frame_info["properties"]:
+            if (handler := _EPC_HANDLERS.get(epc)) is not None:
+                handler(pdc, edt, out)
+        results = dict(zip(SENSOR_KEYS, out, strict=True))
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("B-route read results: %s", results)
+        return results
+
+    def _readlines_nonblocking(self, deadline: float | None = None) -> Iterator[bytes]:
+        """Yield complete lines from the serial port via a persistent buffer.
+
+        Bypasses pyserial's per-read timeout bookkeeping entirely: block
+        in select() on the raw fd, then pull everything available with a
+        single os.readv() into the preallocated buffer. With a deadline,
+        wait exactly the remaining time; otherwise give up once the port
+        stays silent for the idle read timeout.
+        """
+        assert self._fd is not None
+        fd = self._fd
+        while True:
+            idx = self._rxbuf.find(b"\n")
+            while idx < 0:
+                if deadline is not None:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        return
+                else:
+                    remaining = _READ_TIMEOUT
+                if not select.select([fd], [], [], remaining)[0]:
+                    return
+                count = os.readv(fd, [self._mv])
+                if count <= 0:
+                    return
+                self._rxbuf += self._mv[:count]
+                idx = self._rxbuf.find(b"\n")
+            line = bytes(memoryview(self._rxbuf)[:idx])
+            del self._rxbuf[: idx + 1]
+            yield line.rstrip(b"\r")
+
+    def _write_cmd(self, cmd_str: bytes | bytearray | memoryview) -> None:
+        """Send a single SKSTACK-IP command in one write call."""
+        assert self.serial_port is not None
+        assert isinstance(cmd_str, (bytes, bytearray, memoryview))
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            # repr() of the command bytes is surprisingly costly; skip it
+            # unless debug logging is actually on.
+            head = bytes(cmd_str[:16])
+            if head.startswith(_PFX_CREDENTIAL):
+                _LOGGER.debug("Write to meter: %s <redacted>", head.split(b" ", 1)[0])
+            else:
+                _LOGGER.debug("Write to meter: %s", cmd_str)
+        self.serial_port.write(cmd_str)
+
+    def _wait_ok(self) -> None:
+        """Consume lines until the adapter acknowledges the last command."""
+        for raw_line in self._readlines_nonblocking():
+            if raw_line.startswith(_PFX_OK):
+                return
+            if raw_line.startswith(_PFX_FAIL):
+                raise BRouteError(
+                    f"Adapter replied {raw_line.decode(errors='replace')}"
+                )
+        raise BRouteError("Timed out waiting for OK")
+
+    def _scan_channel(self) -> None:
+        """Run active scans until the meter's PAN descriptor is found."""
+        for duration in range(_SCAN_DURATION_MIN, _SCAN_DURATION_MAX + 1):
+            self._write_cmd(f"SKSCAN 2 FFFFFFFF {duration}\r\n".encode())
+            self._wait_ok()
+            # The scan sweeps 28 channels; wait out the full sweep plus margin.
+            deadline = time.monotonic() + 0.0096 * (2**duration) * 32 + 5
+            report = bytearray()
+            scan_done = False
+            while not scan_done and time.monotonic() < deadline:
+                for raw_line in self._readlines_nonblocking():
+                    if raw_line.startswith(_PFX_EVENT_22):
+                        scan_done = True
+                        break
+                    report += raw_line
+                    report += b"\n"
+            if (match := _SCAN_RE.search(report)) is not None:
+                self.scan_res["Channel"] = match[1].decode()
+                self.scan_res["Pan ID"] = match[2].decode()
+                self.scan_res["Addr"] = match[3].decode()
+                return
+        raise BRouteError("Smart meter not found in active scan")
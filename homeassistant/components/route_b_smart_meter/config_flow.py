@@ -0,0 +1,72 @@
+"""Config flow for the Route B Smart Meter integration."""
+
+from __future__ import annotations
+
+import logging
+from typing import Any
+
+import serial
+import voluptuous as vol
+
+from homeassistant.config_entries import ConfigFlow, ConfigFlowResult
+
+from .broute_reader import BRouteConfig, BRouteError, BRouteReader
+from .const import (
+    CONF_ROUTE_B_ID,
+    CONF_ROUTE_B_PWD,
+    CONF_SERIAL_PORT,
+    DEFAULT_SERIAL_PORT,
+    DOMAIN,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+STEP_USER_DATA_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_ROUTE_B_ID): str,
+        vol.Required(CONF_ROUTE_B_PWD): str,
+        vol.Required(CONF_SERIAL_PORT, default=DEFAULT_SERIAL_PORT): str,
+    }
+)
+
+
+class BRouteConfigFlow(ConfigFlow, domain=DOMAIN):
+    """Handle a config flow for Route B Smart Meter."""
+
+    VERSION = 1
+
+    async def async_step_user(
+        self, user_input: dict[str, Any] | None = None
+    ) -> ConfigFlowResult:
+        """Handle the initial step."""
+        errors: dict[str, str] = {}
+        if user_input is not None:
+            await self.async_set_unique_id(user_input[CONF_ROUTE_B_ID])
+            self._abort_if_unique_id_configured()
+
+            reader = BRouteReader(
+                BRouteConfig(
+                    route_b_id=user_input[CONF_ROUTE_B_ID],
+                    route_b_pwd=user_input[CONF_ROUTE_B_PWD],
+                    serial_port=user_input[CONF_SERIAL_PORT],
+                )
+            )
+            try:
+                await self.hass.async_add_executor_job(self._try_connect, reader)
+            except (BRouteError, serial.SerialException):
+                _LOGGER.exception("Cannot connect to the smart meter")
+                errors["base"] = "cannot_connect"
+            else:
+                return self.async_create_entry(title="Smart Meter", data=user_input)
+
+        return self.async_show_form(
+            step_id="user", data_schema=STEP_USER_DATA_SCHEMA, errors=errors
+        )
+
+    @staticmethod
+    def _try_connect(reader: BRouteReader) -> None:
+        """Connect to the meter once to validate the user input."""
+        try:
+            reader.connect()
+        finally:
+            reader.close()
@@ -0,0 +1,30 @@
+"""Constants for the Route B Smart Meter integration."""
+
+from datetime import timedelta
+
+DOMAIN = "route_b_smart_meter"
+
+CONF_ROUTE_B_ID = "route_b_id"
+CONF_ROUTE_B_PWD = "route_b_pwd"
+CONF_SERIAL_PORT = "serial_port"
+
+DEFAULT_SERIAL_PORT = "/dev/ttyS0"
+
+POLLING_INTERVAL = timedelta(seconds=10)
+
+KEY_E7_POWER = "e7_power"
+KEY_E8_CURRENT = "e8_current"
+KEY_E9_VOLTAGE = "e9_voltage"
+KEY_EA_FORWARD = "ea_forward"
+KEY_EB_REVERSE = "eb_reverse"
+
+SENSOR_KEYS = (
+    KEY_E7_POWER,
+    KEY_E8_CURRENT,
+    KEY_E9_VOLTAGE,
+    KEY_EA_FORWARD,
+    KEY_EB_REVERSE,
+)
+
+# Position of each key in the coordinator's snapshot tuple.
+KEY_INDEX = {key: index for index, key in enumerate(SENSOR_KEYS)}
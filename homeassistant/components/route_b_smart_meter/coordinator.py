@@ -0,0 +1,80 @@
+"""Data update coordinator for the Route B smart meter."""
+
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+import logging
+
+import serial
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.device_registry import DeviceInfo
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+
+from .broute_reader import BRouteConfig, BRouteError, BRouteReader
+from .const import DOMAIN, POLLING_INTERVAL, SENSOR_KEYS
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class BRouteDataCoordinator(DataUpdateCoordinator[dict[str, float | None]]):
+    """Coordinator polling a single B-route smart meter."""
+
+    def __init__(self, hass: HomeAssistant, config: BRouteConfig) -> None:
+        """Initialize the coordinator."""
+        super().__init__(
+            hass,
+            _LOGGER,
+            name=DOMAIN,
+            update_interval=POLLING_INTERVAL,
+        )
+        self.route_b_id = config.route_b_id
+        self.reader = BRouteReader(config)
+        # All serial I/O runs on this one thread, so polls never wait
+        # behind unrelated work in the shared executor and the reader
+        # never sees concurrent access.
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="broute")
+        # One meter per entry; all sensors share the same device.
+        self.device_info = DeviceInfo(
+            identifiers={(DOMAIN, config.route_b_id)},
+            name="Smart meter",
+        )
+        # Immutable per-refresh snapshot indexed by KEY_INDEX; the sensors
+        # read their value by position instead of hashing the key.
+        self.snapshot: tuple[float | None, ...] | None = None
+
+    async def _async_setup(self) -> None:
+        """Connect to the meter in a worker thread.
+
+        The scan and PANA join take multiple seconds; running them here
+        instead of in __init__ keeps them off the event loop.
+        """
+        try:
+            await self.hass.loop.run_in_executor(self._executor, self.reader.connect)
+        except (BRouteError, serial.SerialException) as err:
+            # connect() releases the port on handshake failures; close
+            # here as well so no retry ever finds the port still locked.
+            await self.hass.loop.run_in_executor(self._executor, self.reader.close)
+            raise UpdateFailed(f"Error connecting to the smart meter: {err}") from err
+
+    async def _async_update_data(self) -> dict[str, float | None]:
+        """Fetch the latest values from the meter."""
+        try:
+            data = await self.hass.loop.run_in_executor(
+                self._executor, self.reader.get_data
+            )
+        except (BRouteError, serial.SerialException) as err:
+            raise UpdateFailed(
+                f"Error communicating with the smart meter: {err}"
+            ) from err
+        self.snapshot = tuple(data[key] for key in SENSOR_KEYS)
+        return data
+
+    async def async_close_reader(self) -> None:
+        """Close the serial port on the reader's own thread."""
+        await self.hass.loop.run_in_executor(self._executor, self.reader.close)
+
+    async def async_shutdown(self) -> None:
+        """Stop refreshes and release the worker thread."""
+        await super().async_shutdown()
+        self._executor.shutdown(wait=False)
@@ -0,0 +1,114 @@
+"""Sensor platform for the Route B smart meter."""
+
+from __future__ import annotations
+
+from homeassistant.components.sensor import (
+    SensorDeviceClass,
+    SensorEntity,
+    SensorEntityDescription,
+    SensorStateClass,
+)
+from homeassistant.const import (
+    UnitOfElectricCurrent,
+    UnitOfElectricPotential,
+    UnitOfEnergy,
+    UnitOfPower,
+)
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.typing import StateType
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+
+from . import BRouteConfigEntry
+from .const import (
+    KEY_E7_POWER,
+    KEY_E8_CURRENT,
+    KEY_E9_VOLTAGE,
+    KEY_EA_FORWARD,
+    KEY_EB_REVERSE,
+    KEY_INDEX,
+)
+from .coordinator import BRouteDataCoordinator
+
+SENSOR_TYPES: tuple[SensorEntityDescription, ...] = (
+    SensorEntityDescription(
+        key=KEY_E7_POWER,
+        translation_key="instantaneous_power",
+        native_unit_of_measurement=UnitOfPower.WATT,
+        device_class=SensorDeviceClass.POWER,
+        state_class=SensorStateClass.MEASUREMENT,
+    ),
+    SensorEntityDescription(
+        key=KEY_E8_CURRENT,
+        translation_key="instantaneous_current",
+        native_unit_of_measurement=UnitOfElectricCurrent.AMPERE,
+        device_class=SensorDeviceClass.CURRENT,
+        state_class=SensorStateClass.MEASUREMENT,
+    ),
+    SensorEntityDescription(
+        key=KEY_E9_VOLTAGE,
+        translation_key="instantaneous_voltage",
+        native_unit_of_measurement=UnitOfElectricPotential.VOLT,
+        device_class=SensorDeviceClass.VOLTAGE,
+        state_class=SensorStateClass.MEASUREMENT,
+    ),
+    SensorEntityDescription(
+        key=KEY_EA_FORWARD,
+        translation_key="cumulative_energy_forward",
+        native_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
+        device_class=SensorDeviceClass.ENERGY,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+    ),
+    SensorEntityDescription(
+        key=KEY_EB_REVERSE,
+        translation_key="cumulative_energy_reverse",
+        native_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
+        device_class=SensorDeviceClass.ENERGY,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+    ),
+)
+
+
+async def async_setup_entry(
+    hass: HomeAssistant,
+    entry: BRouteConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Set up the smart meter sensors."""
+    coordinator = entry.runtime_data
+    async_add_entities(
+        BRouteSensorEntity(coordinator, description) for description in SENSOR_TYPES
+    )
+
+
+class BRouteSensorEntity(CoordinatorEntity[BRouteDataCoordinator], SensorEntity):
+    """Sensor entity backed by the shared B-route coordinator."""
+
+    _attr_has_entity_name = True
+
+    def __init__(
+        self,
+        coordinator: BRouteDataCoordinator,
+        description: SensorEntityDescription,
+    ) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator)
+        self.entity_description = description
+        self._index = KEY_INDEX[description.key]
+        self._last_state: StateType = None
+        self._attr_unique_id = f"{coordinator.route_b_id}_{description.key}"
+        self._attr_device_info = coordinator.device_info
+
+    @property
+    def native_value(self) -> StateType:
+        """Return the latest value for this sensor's EPC.
+
+        A poll can miss individual properties; keep the previous value
+        instead of flapping to unknown.
+        """
+        if (snapshot := self.coordinator.snapshot) is None:
+            return self._last_state
+        if (value := snapshot[self._index]) is None:
+            return self._last_state
+        self._last_state = value
+        return value
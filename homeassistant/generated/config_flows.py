@@ -513,6 +513,7 @@ FLOWS = {
         "romy",
         "roomba",
         "roon",
+        "route_b_smart_meter",
         "rova",
         "rpi_power",
         "rtsp_to_webrtc",
@@ -0,0 +1,86 @@
+"""Common fixtures for the Route B Smart Meter tests."""
+
+from collections.abc import Generator
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from homeassistant.components.route_b_smart_meter.const import (
+    CONF_ROUTE_B_ID,
+    CONF_ROUTE_B_PWD,
+    CONF_SERIAL_PORT,
+    DOMAIN,
+    KEY_E7_POWER,
+    KEY_E8_CURRENT,
+    KEY_E9_VOLTAGE,
+    KEY_EA_FORWARD,
+    KEY_EB_REVERSE,
+)
+from homeassistant.core import HomeAssistant
+
+from . import setup_integration
+
+from tests.common import MockConfigEntry
+
+MOCK_ROUTE_B_ID = "00112233445566778899AABBCCDDEEFF"
+
+MOCK_CONFIG_DATA = {
+    CONF_ROUTE_B_ID: MOCK_ROUTE_B_ID,
+    CONF_ROUTE_B_PWD: "0123456789AB",
+    CONF_SERIAL_PORT: "/dev/ttyUSB0",
+}
+
+MOCK_METER_DATA = {
+    KEY_E7_POWER: 498,
+    KEY_E8_CURRENT: 5.3,
+    KEY_E9_VOLTAGE: 101.4,
+    KEY_EA_FORWARD: 18599.2,
+    KEY_EB_REVERSE: 4.2,
+}
+
+
+@pytest.fixture
+def mock_setup_entry() -> Generator[AsyncMock]:
+    """Override async_setup_entry."""
+    with patch(
+        "homeassistant.components.route_b_smart_meter.async_setup_entry",
+        return_value=True,
+    ) as mock_setup_entry:
+        yield mock_setup_entry
+
+
+@pytest.fixture
+def mock_config_entry(hass: HomeAssistant) -> MockConfigEntry:
+    """Return the default mocked config entry."""
+    return MockConfigEntry(
+        title="Smart Meter",
+        domain=DOMAIN,
+        data=MOCK_CONFIG_DATA,
+        unique_id=MOCK_ROUTE_B_ID,
+    )
+
+
+@pytest.fixture
+def mock_reader() -> Generator[MagicMock]:
+    """Return a mocked B-route reader."""
+    with (
+        patch(
+            "homeassistant.components.route_b_smart_meter.coordinator.BRouteReader",
+        ) as reader_mock,
+        patch(
+            "homeassistant.components.route_b_smart_meter.config_flow.BRouteReader",
+            new=reader_mock,
+        ),
+    ):
+        reader = reader_mock.return_value
+        reader.get_data.return_value = dict(MOCK_METER_DATA)
+        yield reader
+
+
+@pytest.fixture
+async def init_integration(
+    hass: HomeAssistant, mock_config_entry: MockConfigEntry, mock_reader: MagicMock
+) -> MockConfigEntry:
+    """Set up the Route B Smart Meter integration for testing."""
+    await setup_integration(hass, mock_config_entry)
+    return mock_config_entry
@@ -0,0 +1,254 @@
+"""Test the low-level B-route serial reader against a scripted adapter."""
+
+from collections.abc import Generator
+import contextlib
+import logging
+import os
+import pty
+import struct
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+
+from homeassistant.components.route_b_smart_meter import broute_reader
+from homeassistant.components.route_b_smart_meter.broute_reader import (
+    BRouteConfig,
+    BRouteError,
+    BRouteReader,
+    get_data_batch,
+)
+from homeassistant.components.route_b_smart_meter.const import (
+    KEY_E7_POWER,
+    KEY_E8_CURRENT,
+    KEY_E9_VOLTAGE,
+    KEY_EA_FORWARD,
+    KEY_EB_REVERSE,
+)
+
+MOCK_IPV6 = "FE80:0000:0000:0000:021D:1290:1234:5678"
+
+SCAN_RESPONSE = (
+    b"EVENT 20 FE80:0000:0000:0000:021D:1290:1234:5678\r\n"
+    b"EPANDESC\r\n"
+    b"  Channel:39\r\n"
+    b"  Channel Page:09\r\n"
+    b"  Pan ID:8888\r\n"
+    b"  Addr:001D129012345678\r\n"
+    b"  LQI:E1\r\n"
+    b"  PairID:01234567\r\n"
+    b"EVENT 22 FE80:0000:0000:0000:021D:1290:1234:5678\r\n"
+)
+
+# ECHONET Lite read response: E7=498 W, E8=3.5+1.8 A, E9=(101.3+101.5)/2 V,
+# EA=18599.2 kWh at 2022-12-21 13:30:45 JST, EB=4.2 kWh.
+ECHONET_RESPONSE = bytes.fromhex(
+    "1081000102880105ff017205"
+    "e704000001f2"
+    "e80400230012"
+    "e90403f503f7"
+    "ea0b07e60c150d1e2d0002d688"
+    "eb0b07e60c150d1e2d0000002a"
+)
+
+
+class FakeMeter(threading.Thread):
+    """Drive the master side of a pty like an SKSTACK-IP adapter."""
+
+    def __init__(self, master_fd: int) -> None:
+        """Initialize the scripted adapter."""
+        super().__init__(name="fake-meter", daemon=True)
+        self._fd = master_fd
+        self._buf = b""
+        self.fail_join = False
+        self.poll_count = 0
+        self.response_delay = 0.0
+
+    def run(self) -> None:
+        """Read commands and write the scripted responses."""
+        while True:
+            try:
+                data = os.read(self._fd, 1024)
+            except OSError:
+                return
+            if not data:
+                return
+            self._buf += data
+            while b"\r\n" in self._buf:
+                line, _, self._buf = self._buf.partition(b"\r\n")
+                self._handle(line)
+
+    def _handle(self, line: bytes) -> None:
+        """Respond to a single command line."""
+        responses: list[bytes] = []
+        if line.startswith((b"SKSETPWD", b"SKSETRBID", b"SKSREG")):
+            responses = [line + b"\r\n", b"OK\r\n"]
+        elif line.startswith(b"SKSCAN"):
+            responses = [line + b"\r\n", b"OK\r\n", SCAN_RESPONSE]
+        elif line.startswith(b"SKLL64"):
+            responses = [line + b"\r\n", MOCK_IPV6.encode() + b"\r\n"]
+        elif line.startswith(b"SKJOIN"):
+            if self.fail_join:
+                responses = [line + b"\r\n", b"OK\r\n", b"EVENT 24 \r\n"]
+            else:
+                responses = [line + b"\r\n", b"OK\r\n", b"EVENT 25 \r\n"]
+        elif line.startswith(b"SKSENDTO"):
+            if self.response_delay:
+                time.sleep(self.response_delay)
+                self.response_delay = 0.0
+            responses = [b"EVENT 21 \r\n", b"OK\r\n", self._erxudp_line()]
+        for response in responses:
+            os.write(self._fd, response)
+
+    def _erxudp_line(self) -> bytes:
+        """Build the next poll response, bumping E7 by one watt per poll.
+
+        The distinct values let tests tell which request a response
+        answered.
+        """
+        frame = bytearray(ECHONET_RESPONSE)
+        struct.pack_into(">i", frame, 14, 498 + self.poll_count)
+        self.poll_count += 1
+        return (
+            b"ERXUDP " + MOCK_IPV6.encode() + b" " + MOCK_IPV6.encode() + b" 0E1A 0E1A "
+            b"001D129012345678 1 "
+            + f"{len(frame):04X}".encode()
+            + b" "
+            + frame.hex().upper().encode()
+            + b"\r\n"
+        )
+
+
+@pytest.fixture
+def fake_meter() -> Generator[tuple[FakeMeter, str]]:
+    """Return a scripted adapter attached to a pty."""
+    master_fd, slave_fd = pty.openpty()
+    meter = FakeMeter(master_fd)
+    meter.start()
+    try:
+        yield meter, os.ttyname(slave_fd)
+    finally:
+        # Closing the last slave fd makes the master read EOF and end the thread.
+        os.close(slave_fd)
+        meter.join(timeout=5)
+        with contextlib.suppress(OSError):
+            os.close(master_fd)
+
+
+def test_connect_and_get_data(fake_meter: tuple[FakeMeter, str]) -> None:
+    """Test the full connect and poll conversation."""
+    _, port = fake_meter
+    reader = BRouteReader(
+        BRouteConfig("00112233445566778899AABBCCDDEEFF", "0123456789AB", port)
+    )
+    try:
+        reader.connect()
+
+        assert reader.scan_res["Channel"] == "39"
+        assert reader.scan_res["Pan ID"] == "8888"
+        assert reader.scan_res["Addr"] == "001D129012345678"
+        assert reader.ipv6_addr == MOCK_IPV6
+
+        data = reader.get_data()
+    finally:
+        reader.close()
+
+    assert data[KEY_E7_POWER] == 498
+    assert data[KEY_E8_CURRENT] == 5.3
+    assert data[KEY_E9_VOLTAGE] == 101.4
+    assert data[KEY_EA_FORWARD] == 18599.2
+    assert data[KEY_EB_REVERSE] == 4.2
+
+
+def test_connect_redacts_credentials(
+    fake_meter: tuple[FakeMeter, str], caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test the credentials never appear in the debug command log."""
+    _, port = fake_meter
+    caplog.set_level(logging.DEBUG)
+    reader = BRouteReader(
+        BRouteConfig("00112233445566778899AABBCCDDEEFF", "0123456789AB", port)
+    )
+    try:
+        reader.connect()
+    finally:
+        reader.close()
+
+    assert "<redacted>" in caplog.text
+    assert "0123456789AB" not in caplog.text
+    assert "00112233445566778899AABBCCDDEEFF" not in caplog.text
+
+
+def test_get_data_pipelined(fake_meter: tuple[FakeMeter, str]) -> None:
+    """Test consecutive polls consume the pipelined in-flight response."""
+    _, port = fake_meter
+    reader = BRouteReader(
+        BRouteConfig("00112233445566778899AABBCCDDEEFF", "0123456789AB", port)
+    )
+    try:
+        reader.connect()
+        first = reader.get_data()
+        second = reader.get_data()
+    finally:
+        reader.close()
+
+    # Each poll returns its own response, not a replay of the previous one.
+    assert first[KEY_E7_POWER] == 498
+    assert second[KEY_E7_POWER] == 499
+    assert first[KEY_EA_FORWARD] == second[KEY_EA_FORWARD] == 18599.2
+
+
+def test_get_data_resyncs_after_timeout(fake_meter: tuple[FakeMeter, str]) -> None:
+    """Test a late response from a timed-out poll is never served as fresh."""
+    meter, port = fake_meter
+    meter.response_delay = 0.5
+    reader = BRouteReader(
+        BRouteConfig("00112233445566778899AABBCCDDEEFF", "0123456789AB", port)
+    )
+    try:
+        reader.connect()
+        with (
+            patch.object(broute_reader, "_RESPONSE_TIMEOUT", 0.1),
+            pytest.raises(BRouteError, match="No ERXUDP"),
+        ):
+            reader.get_data()
+        # Let the late response for the timed-out request reach the buffer.
+        time.sleep(0.6)
+        data = reader.get_data()
+    finally:
+        reader.close()
+
+    # The stale response (E7=498) must be discarded, not returned.
+    assert data[KEY_E7_POWER] == 499
+
+
+def test_get_data_batch() -> None:
+    """Test the vectorized batch parser against the scalar reference values."""
+    batch = get_data_batch([ECHONET_RESPONSE] * 3)
+
+    assert all(len(values) == 3 for values in batch.values())
+    assert list(batch[KEY_E7_POWER]) == [498] * 3
+    assert list(batch[KEY_E8_CURRENT]) == [5.3] * 3
+    assert list(batch[KEY_E9_VOLTAGE]) == [101.4] * 3
+    assert list(batch[KEY_EA_FORWARD]) == [18599.2] * 3
+    assert list(batch[KEY_EB_REVERSE]) == [4.2] * 3
+
+    with pytest.raises(BRouteError, match="frame length"):
+        get_data_batch([ECHONET_RESPONSE[:-1]])
+
+
+def test_connect_pana_failure(fake_meter: tuple[FakeMeter, str]) -> None:
+    """Test a failed PANA authentication raises."""
+    meter, port = fake_meter
+    meter.fail_join = True
+    reader = BRouteReader(
+        BRouteConfig("00112233445566778899AABBCCDDEEFF", "0123456789AB", port)
+    )
+    try:
+        with pytest.raises(BRouteError, match="PANA authentication failed"):
+            reader.connect()
+        # The port and its exclusive lock must be released on failure.
+        assert reader.serial_port is None
+    finally:
+        reader.close()
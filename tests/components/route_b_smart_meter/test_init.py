@@ -0,0 +1,39 @@
+"""Test the Route B Smart Meter integration setup."""
+
+from unittest.mock import MagicMock
+
+from homeassistant.components.route_b_smart_meter.broute_reader import BRouteError
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.core import HomeAssistant
+
+from . import setup_integration
+
+from tests.common import MockConfigEntry
+
+
+async def test_load_unload_entry(
+    hass: HomeAssistant,
+    init_integration: MockConfigEntry,
+    mock_reader: MagicMock,
+) -> None:
+    """Test loading and unloading a config entry."""
+    assert init_integration.state is ConfigEntryState.LOADED
+
+    await hass.config_entries.async_unload(init_integration.entry_id)
+    await hass.async_block_till_done()
+
+    assert init_integration.state is ConfigEntryState.NOT_LOADED
+    mock_reader.close.assert_called_once()
+
+
+async def test_setup_entry_cannot_connect(
+    hass: HomeAssistant,
+    mock_config_entry: MockConfigEntry,
+    mock_reader: MagicMock,
+) -> None:
+    """Test the entry is retried when the meter is unreachable."""
+    mock_reader.connect.side_effect = BRouteError("No meter found")
+
+    await setup_integration(hass, mock_config_entry)
+
+    assert mock_config_entry.state is ConfigEntryState.SETUP_RETRY
@@ -0,0 +1,69 @@
+"""Test the Route B Smart Meter sensors."""
+
+from unittest.mock import MagicMock
+
+from freezegun.api import FrozenDateTimeFactory
+import serial
+
+from homeassistant.components.route_b_smart_meter.const import (
+    KEY_E7_POWER,
+    POLLING_INTERVAL,
+)
+from homeassistant.const import STATE_UNAVAILABLE
+from homeassistant.core import HomeAssistant
+
+from .conftest import MOCK_METER_DATA
+
+from tests.common import MockConfigEntry, async_fire_time_changed
+
+
+async def test_sensor_states(
+    hass: HomeAssistant,
+    init_integration: MockConfigEntry,
+) -> None:
+    """Test the initial states of all meter sensors."""
+    assert hass.states.get("sensor.smart_meter_instantaneous_power").state == "498"
+    assert hass.states.get("sensor.smart_meter_instantaneous_current").state == "5.3"
+    assert hass.states.get("sensor.smart_meter_instantaneous_voltage").state == "101.4"
+    assert (
+        hass.states.get("sensor.smart_meter_cumulative_energy_forward").state
+        == "18599.2"
+    )
+    assert (
+        hass.states.get("sensor.smart_meter_cumulative_energy_reverse").state == "4.2"
+    )
+
+
+async def test_sensor_keeps_last_state(
+    hass: HomeAssistant,
+    init_integration: MockConfigEntry,
+    mock_reader: MagicMock,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test a sensor keeps its value when a poll misses its property."""
+    partial_data = dict(MOCK_METER_DATA)
+    partial_data[KEY_E7_POWER] = None
+    mock_reader.get_data.return_value = partial_data
+
+    freezer.tick(POLLING_INTERVAL)
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done(wait_background_tasks=True)
+
+    assert hass.states.get("sensor.smart_meter_instantaneous_power").state == "498"
+
+
+async def test_sensor_unavailable_on_update_error(
+    hass: HomeAssistant,
+    init_integration: MockConfigEntry,
+    mock_reader: MagicMock,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test the sensors become unavailable when a poll fails."""
+    mock_reader.get_data.side_effect = serial.SerialException("read failed")
+
+    freezer.tick(POLLING_INTERVAL)
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done(wait_background_tasks=True)
+
+    state = hass.states.get("sensor.smart_meter_instantaneous_power")
+    assert state.state == STATE_UNAVAILABLE